@@ -1,7 +1,15 @@
 from __future__ import annotations
-import os, shutil, sys
+import functools, itertools, os, shutil, sys
+from collections import deque
 from pathlib import Path
-from typing import Optional, Iterable
+from typing import Iterable, Iterator, Optional
+
+_IS_WIN: bool = sys.platform.startswith("win")
+
+# Supported tools → their dedicated override env var (e.g. ANDROID_ADB)
+_TOOL_ENV_KEYS: dict[str, str] = {
+    tool: f"ANDROID_{tool.upper()}" for tool in ("adb", "emulator", "avdmanager")
+}
 
 # ---------- Core helper ------------------------------------------------------
 def find_android_tool(tool: str) -> Path:
@@ -16,22 +24,43 @@ def find_android_tool(tool: str) -> Path:
       5. User-supplied fallback directories via FIND_ANDROID_EXTRA_DIRS env var
     Raises:
         FileNotFoundError if nothing is found.
+
+    Successful lookups are cached per tool and per snapshot of the relevant
+    env vars; call ``find_android_tool.cache_clear()`` to force a re-scan.
     """
-    if tool not in {"adb", "emulator", "avdmanager"}:
+    if tool not in _TOOL_ENV_KEYS:
         raise ValueError(f"Unsupported tool: {tool}")
 
+    env = os.environ
+    env_sig = (
+        env.get(_TOOL_ENV_KEYS[tool]),
+        env.get("PATH"),
+        env.get("ANDROID_SDK_ROOT"),
+        env.get("ANDROID_HOME"),
+        env.get("FIND_ANDROID_EXTRA_DIRS"),
+    )
+    return _find_cached(tool, env_sig)
+
+@functools.lru_cache(maxsize=None)
+def _find_cached(tool: str, env_sig: tuple[Optional[str], ...]) -> Path:
+    """Uncached lookup behind `find_android_tool`; `env_sig` is the cache key."""
+    explicit, _path, sdk_root, android_home, extra = env_sig
+
     # 1. Dedicated env var?
-    explicit = os.getenv(f"ANDROID_{tool.upper()}")
-    if explicit and Path(explicit).expanduser().is_file():
-        return Path(explicit).expanduser()
+    if explicit:
+        p = Path(explicit).expanduser()
+        if p.is_file():
+            return p
 
     # 2. Already on PATH?
-    path_hit = shutil.which(tool) or shutil.which(_windows_name(tool))
+    # (one PATH walk: on POSIX both names are identical, on Windows the
+    # suffixed name is the real file)
+    path_hit = shutil.which(_windows_name(tool))
     if path_hit:
         return Path(path_hit)
 
     # 3. Look under ANDROID_SDK_ROOT / ANDROID_HOME
-    sdk_root = os.getenv("ANDROID_SDK_ROOT") or os.getenv("ANDROID_HOME")
+    sdk_root = sdk_root or android_home
     if sdk_root:
         p = _scan_sdk(Path(sdk_root), tool)
         if p:
@@ -44,10 +73,9 @@ def find_android_tool(tool: str) -> Path:
             return p
 
     # 5. Extra dirs (comma-separated)
-    extra = os.getenv("FIND_ANDROID_EXTRA_DIRS", "")
-    for root in map(str.strip, extra.split(",")):
+    for root in map(str.strip, (extra or "").split(",")):
         if root:
-            p = _scan_sdk(Path(root).expanduser(), tool, deep=True)
+            p = _scan_sdk(Path(root), tool, deep=True)
             if p:
                 return p
 
@@ -56,57 +84,93 @@ def find_android_tool(tool: str) -> Path:
         "Install Android SDK Platform-Tools / Emulator or set ANDROID_SDK_ROOT."
     )
 
+find_android_tool.cache_clear = _find_cached.cache_clear
+
 # ---------- Helpers ----------------------------------------------------------
+# avdmanager is a .bat; emulator & adb are .exe
+_WIN_NAMES: dict[str, str] = (
+    {"avdmanager": "avdmanager.bat", "emulator": "emulator.exe", "adb": "adb.exe"}
+    if _IS_WIN
+    else {}
+)
+
 def _windows_name(tool: str) -> str:
     """Return the executable name for Windows builds."""
-    if sys.platform.startswith("win"):
-        # avdmanager is a .bat; emulator & adb are .exe
-        return f"{tool}.bat" if tool == "avdmanager" else f"{tool}.exe"
-    return tool
+    return _WIN_NAMES.get(tool, tool)
 
 def _scan_sdk(root: Path, tool: str, deep: bool = False) -> Optional[Path]:
     """Search the SDK tree for the requested tool."""
     root = root.expanduser()
     exe = _windows_name(tool)
-    subdirs: dict[str, Iterable[Path]] = {
-        "adb":        [root / "platform-tools"],
-        "emulator":   [root / "emulator"],
-        "avdmanager": (
-            (root / "cmdline-tools").glob("*/bin")   # new cmdline-tools path
-            if deep or (root / "cmdline-tools").exists()
-            else []
-        ),
-    }
-    # Legacy path for avdmanager (pre-cmdline-tools)
-    if tool == "avdmanager":
-        subdirs["avdmanager"] = list(subdirs["avdmanager"]) + [root / "tools" / "bin"]
-
-    for d in subdirs[tool]:
+    candidates: Iterable[Path]
+    if tool == "adb":
+        candidates = (root / "platform-tools",)
+    elif tool == "emulator":
+        candidates = (root / "emulator",)
+    else:
+        # new cmdline-tools path, then the legacy (pre-cmdline-tools) one
+        candidates = itertools.chain(_iter_cmdline_bin(root), (root / "tools" / "bin",))
+
+    for d in candidates:
         cand = d / exe
         if cand.is_file():
             return cand
 
-    if deep:  # exhaustive scan when requested
-        for cand in root.rglob(exe):
-            return cand
+    if deep:  # bounded breadth-first scan when requested
+        return _walk_for(root, exe)
+    return None
+
+def _iter_cmdline_bin(root: Path) -> Iterator[Path]:
+    """Yield ``cmdline-tools/<version>/bin`` dirs with a single scandir."""
+    try:
+        with os.scandir(root / "cmdline-tools") as it:
+            for entry in it:
+                if entry.is_dir():  # "latest" may be a symlink
+                    yield Path(entry.path) / "bin"
+    except OSError:
+        return
+
+# Directories that never hold the command-line tools but can be huge
+_PRUNE_DIRS = frozenset({".git", "build", "caches", "system-images"})
+
+def _walk_for(root: Path, exe: str, max_depth: int = 6) -> Optional[Path]:
+    """Breadth-first search below *root* for a file named *exe*."""
+    queue: deque[tuple[str, int]] = deque([(str(root), 0)])
+    while queue:
+        dir_, depth = queue.popleft()
+        try:
+            with os.scandir(dir_) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name == exe and entry.is_file():
+                return Path(entry.path)
+            if (
+                depth < max_depth
+                and entry.name not in _PRUNE_DIRS
+                and entry.is_dir(follow_symlinks=False)
+            ):
+                queue.append((entry.path, depth + 1))
     return None
 
-def _default_sdk_roots() -> list[Path]:
-    """Return typical SDK install roots for each OS."""
+@functools.lru_cache(maxsize=None)
+def _default_sdk_roots() -> tuple[Path, ...]:
+    """Return typical SDK install roots for each OS (computed once)."""
     home = Path.home()
     if sys.platform.startswith("darwin"):   # macOS
-        return [
+        return (
             Path("~/Library/Android/sdk").expanduser(),
             home / "Android" / "Sdk",
-        ]
-    elif sys.platform.startswith("win"):    # Windows
-        return [
+        )
+    elif _IS_WIN:                            # Windows
+        return (
             Path(os.environ.get("LOCALAPPDATA", "")) /
             "Android" / "Sdk",
             home / "AppData" / "Local" / "Android" / "Sdk",
-        ]
+        )
     else:                                    # Linux / WSL
-        return [
+        return (
             home / "Android" / "Sdk",
             Path("/opt/android-sdk"),
-        ]
\ No newline at end of file
+        )
@@ -6,7 +6,7 @@ plus a handful of quality-of-life additions.
 
 * Depends on **`adbutils`** for all ADB interactions (no subprocess fall-backs)
 * Portable discovery of SDK tools via an exhaustive `find_android_tool`
-* Dataclass models for `Target` and `Device`
+* Slotted dataclass models for `Target`, `Device` (frozen) and `AVD`
 * Full lifecycle helpers on :class:`AVD`
 """
 from __future__ import annotations
@@ -14,22 +14,23 @@ from __future__ import annotations
 ###############################################################################
 # Standard library
 ###############################################################################
+import asyncio
 import logging
 import os
 import re
 import shlex
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from dataclasses import dataclass, replace
-from pathlib import Path
-from typing import Final, Iterable, Iterator, List, Optional, ClassVar
+from dataclasses import InitVar, dataclass, field
+from typing import Any, Callable, ClassVar, Final, Iterable, Iterator, List, Optional
 
 ###############################################################################
 # Third-party
 ###############################################################################
 import adbutils  # pip install adbutils
-from collections import namedtuple
 
 from android_sdk_utils._android_sdk_utils import find_android_tool
 
@@ -61,14 +62,9 @@ class BootTimeoutError(TimeoutError):
 # Helper wrappers
 ###############################################################################
 
-def _run(cmd: List[str], *, timeout: int | None = None) -> subprocess.CompletedProcess[bytes]:
-    # On Windows, any on-disk file without .exe/.com gets launched via cmd.exe
-    if sys.platform.startswith("win") and cmd:
-        exe_path = Path(cmd[0])
-        if exe_path.is_file() and exe_path.suffix.lower() not in {".exe", ".com"}:
-            cmd = ["cmd", "/c", *cmd]
-
-    logger.debug("$ %s", " ".join(map(shlex.quote, cmd)))
+def _run(cmd: List[str], *, timeout: int | None = None) -> subprocess.CompletedProcess[str]:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("$ %s", shlex.join(cmd))
     try:
         # Capture stdout/stderr; check=True so we get CalledProcessError on failure
         return subprocess.run(
@@ -76,7 +72,10 @@ def _run(cmd: List[str], *, timeout: int | None = None) -> subprocess.CompletedP
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=True,
-            timeout=timeout
+            timeout=timeout,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
         )
     except subprocess.CalledProcessError as e:
         # Treat failures (e.g. stubbed avdmanager list) as “no output”
@@ -87,30 +86,206 @@ def _run(cmd: List[str], *, timeout: int | None = None) -> subprocess.CompletedP
         return subprocess.CompletedProcess(
             args=e.cmd,
             returncode=e.returncode,
-            stdout=e.stdout or b"",
-            stderr=e.stderr or b"",
+            stdout=e.stdout or "",
+            stderr=e.stderr or "",
         )
 
 
+def _run_lines(cmd: List[str], *, timeout: float | None = None) -> Iterator[str]:
+    """Yield *cmd*'s stdout line by line while it is still running.
+
+    stderr is spooled to a temporary file (so a chatty tool cannot block on a
+    full pipe) and logged as a warning if the command fails. After *timeout*
+    seconds the command is killed and `subprocess.TimeoutExpired` is raised.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("$ %s", shlex.join(cmd))
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=err,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+        expired = threading.Event()
+
+        def expire() -> None:
+            expired.set()
+            proc.kill()
+
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, expire)
+            timer.daemon = True
+            timer.start()
+        finished = False
+        try:
+            for line in proc.stdout:
+                yield line.rstrip("\r\n")
+            finished = True
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if not finished and proc.poll() is None:  # consumer stopped early
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if proc.returncode:
+            err.seek(0)
+            logger.warning(
+                "Command %r exited %d: %s",
+                cmd,
+                proc.returncode,
+                err.read().decode("utf-8", "replace").strip(),
+            )
+
+
+_ADB_CLIENT: adbutils.AdbClient | None = None
+
+
 def _adb_client() -> adbutils.AdbClient:
-    return adbutils.AdbClient(host="127.0.0.1", port=5037)
+    """Return the shared client that talks to the adb server on 127.0.0.1:5037."""
+    global _ADB_CLIENT
+    if _ADB_CLIENT is None:
+        _ADB_CLIENT = adbutils.AdbClient(host="127.0.0.1", port=5037)
+    return _ADB_CLIENT
 
 
 ###############################################################################
-# Resolve tool paths once at import time
+# Resolve tool paths lazily, on first use
 ###############################################################################
-try:
-    _TOOLS = namedtuple("_Tools", "avdmanager emulator adb")(
-        str(find_android_tool("avdmanager")),
-        str(find_android_tool("emulator")),
-        str(find_android_tool("adb")),
-    )
-except FileNotFoundError as exc:
-    raise AndroidToolNotFound(exc) from exc
+_TOOL_CACHE: dict[str, tuple[str, ...]] = {}
+
+
+def _tool(name: str) -> tuple[str, ...]:
+    """Return the argv prefix that launches SDK tool *name* (resolved once)."""
+    argv = _TOOL_CACHE.get(name)
+    if argv is None:
+        try:
+            path = find_android_tool(name)
+        except FileNotFoundError as exc:
+            raise AndroidToolNotFound(exc) from exc
+        # On Windows, anything but .exe/.com (i.e. avdmanager.bat) needs cmd.exe
+        if sys.platform.startswith("win") and path.suffix.lower() not in {".exe", ".com"}:
+            argv = ("cmd", "/c", str(path))
+        else:
+            argv = (str(path),)
+        _TOOL_CACHE[name] = argv
+    return argv
+
+# `{product: serial}` snapshot of `adb devices -l`, shared by boot waits
+_SERIAL_MAP_TTL: Final = 2.0
+_serial_map_cache: tuple[float, dict[str, str]] | None = None
+# async boot waits poll from worker threads; one of them re-lists at a time
+_SERIAL_MAP_LOCK: Final = threading.Lock()
+_BOOT_PROP_CMD: Final = ["getprop", "sys.boot_completed"]
+# where an emulator reports the AVD it runs (newer images, then older ones)
+_AVD_NAME_PROPS: Final = ("ro.boot.qemu.avd_name", "ro.kernel.qemu.avd_name")
+
+###############################################################################
+# Table-driven parser shared by every `avdmanager list …` flavour
+###############################################################################
+# A schema maps an upper-cased `Key:` label to a setter that stores the
+# converted value into the record's keyword-argument dict
+_Setter = Callable[[dict[str, Any], str], None]
+# A record-level search: a pattern looked for once in the whole record text,
+# plus what to store from its match
+_Search = tuple[re.Pattern[str], Callable[[dict[str, Any], re.Match[str]], None]]
+
+# One `Key: value` line; the key stops at the first colon
+_KV_RE: Final = re.compile(
+    r"^[ \t]*(?P<key>[^:\n]+?)[ \t]*:[ \t]*(?P<value>[^\n]*?)[ \t]*$", re.M
+)
+_ID_VALUE_RE: Final = re.compile(r'(\d+) or "([^"]+)"')
+# The dashed rule between records
+_SEPARATOR_RE: Final = re.compile(r"^[ \t]*-{4,}[ \t]*$", re.M)
+# One `id: N or "alias"` record of `list target|device`, up to the next one
+_ID_RECORD_RE: Final = re.compile(r"^[ \t]*id:.*?(?=^[ \t]*id:|\Z)", re.M | re.S)
+
+
+def _field(attr: str, convert: Callable[[str], Any] = str) -> _Setter:
+    def setter(fields: dict[str, Any], value: str) -> None:
+        fields[attr] = convert(value)
+
+    return setter
+
+
+def _set_id(fields: dict[str, Any], value: str) -> None:
+    if m := _ID_VALUE_RE.match(value):
+        fields["id"] = int(m[1])
+        fields["id_alias"] = m[2]
+
+
+def _chunks(lines: Iterable[str] | str) -> Iterator[str]:
+    """Regroup *lines* into `----`-delimited chunks so parsing can stream.
+
+    Raw text is split on the separator lines in one pass.
+    """
+    if isinstance(lines, str):
+        yield from (c for c in _SEPARATOR_RE.split(lines) if c.strip())
+        return
+    buf: List[str] = []
+    for line in lines:
+        if _SEPARATOR_RE.match(line):
+            if (chunk := "\n".join(buf)).strip():
+                yield chunk
+            buf = []
+        else:
+            buf.append(line)
+    if (chunk := "\n".join(buf)).strip():
+        yield chunk
+
+
+def _parse_records(
+    lines: Iterable[str] | str,
+    record_re: re.Pattern[str],
+    schema: dict[str, _Setter],
+    searches: Iterable[_Search] = (),
+) -> Iterator[dict[str, Any]]:
+    """Yield one keyword-argument dict per *record_re* match.
+
+    Plain `Key: value` lines are filled via *schema*; structured lines are
+    pulled out by *searches*, each run once over the record text.
+    """
+    for chunk in _chunks(lines):
+        for rec in record_re.finditer(chunk):
+            record = rec[0]
+            fields: dict[str, Any] = {}
+            for kv in _KV_RE.finditer(record):
+                if setter := schema.get(kv["key"].upper()):
+                    setter(fields, kv["value"])
+            for pattern, apply in searches:
+                if m := pattern.search(record):
+                    apply(fields, m)
+            yield fields
+
 
 ###############################################################################
 # Target & Device dataclasses
 ###############################################################################
+# low-cardinality values (type, OEM, tag) are interned to share one str
+_TARGET_SCHEMA: Final[dict[str, _Setter]] = {
+    "ID": _set_id,
+    "NAME": _field("name"),
+    "TYPE": _field("target_type", sys.intern),
+    "API LEVEL": _field("api_level", int),
+    "REVISION": _field("revision", int),
+}
+_DEVICE_SCHEMA: Final[dict[str, _Setter]] = {
+    "ID": _set_id,
+    "NAME": _field("name"),
+    "OEM": _field("oem", sys.intern),
+    "TAG": _field("tag", sys.intern),
+}
+
+# strips "(Google Pixel 4)"-style annotations from a device string
+_DEVICE_CLEAN_RE: Final = re.compile(r"[\[(].*?[\])]")
+
 @dataclass(frozen=True, slots=True)
 class Target:
     id: int = -1
@@ -120,47 +295,18 @@ class Target:
     api_level: Optional[int] = None
     revision: Optional[int] = None
 
-    _ID_RE: ClassVar[Final[re.Pattern[str]]] = re.compile(r"id: (\d+) or \"([^\"]+)\"")
-
     def is_empty(self) -> bool:
         return self.id == -1
 
     @classmethod
-    def _parse(cls, lines: Iterable[str]) -> Iterator["Target"]:
-        cur: Target | None = None
-        mapping = {
-            "NAME": "name",
-            "TYPE": "target_type",
-            "API LEVEL": "api_level",
-            "REVISION": "revision",
-        }
-        for raw in lines:
-            line = raw.strip()
-            if not line:
-                continue
-            if line.startswith("----------"):
-                if cur and not cur.is_empty():
-                    yield cur
-                cur = Target()
-                continue
-            if cur is None:
-                cur = Target()
-            if m := cls._ID_RE.match(line):
-                cur = replace(cur, id=int(m[1]), id_alias=m[2])
-                continue
-            if ":" in line:
-                k, v = (s.strip() for s in line.split(":", 1))
-                if attr := mapping.get(k.upper()):
-                    cur = replace(
-                        cur, **{attr: int(v) if attr in ("api_level", "revision") else v}
-                    )
-        if cur and not cur.is_empty():
-            yield cur
+    def _parse(cls, lines: Iterable[str] | str) -> Iterator["Target"]:
+        for fields in _parse_records(lines, _ID_RECORD_RE, _TARGET_SCHEMA):
+            if "id" in fields:
+                yield cls(**fields)
 
     @classmethod
     def get_targets(cls) -> List["Target"]:
-        cp = _run([_TOOLS.avdmanager, "list", "target"])
-        return list(cls._parse(cp.stdout.decode().splitlines()))
+        return list(cls._parse(_run_lines([*_tool("avdmanager"), "list", "target"])))
 
 
 @dataclass(frozen=True, slots=True)
@@ -171,82 +317,107 @@ class Device:
     oem: Optional[str] = None
     tag: str = ""
 
-    _ID_RE: ClassVar[Final[re.Pattern[str]]] = re.compile(
-        r"id: (\d+) or \"([^\"]+)\""
-    )
+    _cache: ClassVar[Optional[List["Device"]]] = None
+    # (catalogue the tables were built from, by alias, by display string)
+    _index: ClassVar[
+        tuple[Optional[List["Device"]], dict[str | None, "Device"], dict[str, "Device"]]
+    ] = (None, {}, {})
+
     def is_empty(self) -> bool:
         return self.id == -1
 
     @classmethod
-    def _parse(cls, lines: Iterable[str]) -> Iterator["Device"]:
-        cur: Device | None = None
-        mapping = {"NAME": "name", "OEM": "oem", "TAG": "tag"}
-        for raw in lines:
-            line = raw.strip()
-            if not line:
-                continue
-            if line.startswith("---------"):
-                if cur and not cur.is_empty():
-                    yield cur
-                cur = Device()
-                continue
-            if cur is None:
-                cur = Device()
-            if m := cls._ID_RE.match(line):
-                cur = replace(cur, id=int(m[1]), id_alias=m[2])
-                continue
-            if ":" in line:
-                k, v = (s.strip() for s in line.split(":", 1))
-                if attr := mapping.get(k.upper()):
-                    cur = replace(cur, **{attr: v})
-        if cur and not cur.is_empty():
-            yield cur
+    def _parse(cls, lines: Iterable[str] | str) -> Iterator["Device"]:
+        for fields in _parse_records(lines, _ID_RECORD_RE, _DEVICE_SCHEMA):
+            if "id" in fields:
+                yield cls(**fields)
 
     @classmethod
     def get_devices(cls) -> List["Device"]:
-        cp = _run([_TOOLS.avdmanager, "list", "device"])
-        return list(cls._parse(cp.stdout.decode().splitlines()))
+        """Return the device catalogue, listed once and reused until `refresh`.
+
+        An empty listing (e.g. avdmanager failed) is not cached, so the next
+        call tries again.
+        """
+        if cls._cache:
+            return cls._cache
+        devices = list(cls._parse(_run_lines([*_tool("avdmanager"), "list", "device"])))
+        if devices:
+            cls._cache = devices
+        return devices
+
+    @classmethod
+    def refresh(cls) -> None:
+        """Forget the cached catalogue; the next `get_devices` re-lists."""
+        cls._cache = None
+
+    @classmethod
+    def _lookup_tables(
+        cls,
+    ) -> tuple[Optional[List["Device"]], dict[str | None, "Device"], dict[str, "Device"]]:
+        """Build the lookup dicts over `get_devices()`, again only if it changed."""
+        devices = cls.get_devices()
+        if cls._index[0] is not devices:
+            by_display: dict[str, Device] = {}
+            for d in devices:
+                # avdmanager prints "alias (OEM)"; "alias (name)" is accepted too
+                by_display[f"{d.id_alias} ({d.name})"] = d
+                by_display.setdefault(f"{d.id_alias} ({d.oem})", d)
+            cls._index = (devices, {d.id_alias: d for d in devices}, by_display)
+        return cls._index
+
+    @classmethod
+    def _by_alias(cls) -> dict[str | None, "Device"]:
+        """Alias → Device view of `get_devices()`."""
+        return cls._lookup_tables()[1]
+
+    @classmethod
+    def _by_display(cls) -> dict[str, "Device"]:
+        """``"alias (name)"`` / ``"alias (OEM)"`` → Device view of `get_devices()`."""
+        return cls._lookup_tables()[2]
 
 
 ###############################################################################
 # AVD class
 ###############################################################################
-class AVD:
-    """High-level wrapper around one AVD entry."""
-
-    __slots__ = (
-        "name",
-        "_device",
-        "path",
-        "target",
-        "skin",
-        "sdcard_size",
-        "based_on",
-        "abi",
-        "process",
-    )
+# `{name: AVD}` from the last `AVD.get_avds()`; None until listed or after
+# any create/delete/rename
+_AVD_INDEX: dict[str, "AVD"] | None = None
 
-    def __init__(
-        self,
-        *,
-        name: str = "invalid",
-        device: Device | None = None,
-        path: str | None = None,
-        target: str | None = None,
-        skin: str | None = None,
-        sdcard_size: str | None = None,
-        based_on: str | None = None,
-        abi: str | None = None,
-    ) -> None:
-        self.name = name
-        self._device = device
-        self.path = path
-        self.target = target
-        self.skin = skin
-        self.sdcard_size = sdcard_size
-        self.based_on = based_on
-        self.abi = abi
-        self.process: subprocess.Popen[bytes] | None = None
+
+def _invalidate_avd_index() -> None:
+    global _AVD_INDEX
+    _AVD_INDEX = None
+
+
+@dataclass(slots=True, eq=False, kw_only=True)
+class AVD:
+    """High-level wrapper around one AVD entry.
+
+    Unlike `Target`/`Device` this is mutable (``rename`` and the ``device``
+    setter update it in place) and compares by identity, so it stays hashable.
+    ``device=`` is init-only and goes through the ``device`` setter; the
+    resolved `Device` is kept in ``_device``.
+    """
+
+    name: str = "invalid"
+    device: InitVar[Device | str | None] = None
+    path: Optional[str] = None
+    target: Optional[str] = None
+    skin: Optional[str] = None
+    sdcard_size: Optional[str] = None
+    based_on: Optional[str] = None
+    abi: Optional[str] = None
+    _device: Device | None = field(default=None, init=False, repr=False)
+    process: subprocess.Popen[bytes] | None = field(default=None, init=False, repr=False)
+    # adb serial of the running emulator, remembered across boot waits
+    _serial: str | None = field(default=None, init=False, repr=False)
+    # fixed `avdmanager` sub-command of `create`
+    _CREATE_PREFIX: ClassVar[tuple[str, ...]] = ("create", "avd")
+
+    def __post_init__(self, device: Device | str | None) -> None:
+        if device is not None:
+            self._set_device(device)
 
     # ---------------------------------------------------------------- misc
     def __repr__(self) -> str:  # pragma: no cover
@@ -256,26 +427,38 @@ class AVD:
         return self.name == "invalid"
 
     # ---------------------------------------------------------------- device
-    @property
-    def device(self) -> Device | None:
+    def _get_device(self) -> Device | None:
         return self._device
 
-    @device.setter
-    def device(self, device_str: str) -> None:
-        cleaned = re.sub(r"[\[(].*?[\])]", "", device_str).strip()
-        self._device = next(
-            (d for d in Device.get_devices() if d.id_alias == cleaned), None
+    def _set_device(self, device: Device | str) -> None:
+        if isinstance(device, Device):
+            self._device = device
+            return
+        resolved = Device._by_display().get(device.strip()) or Device._by_alias().get(
+            _DEVICE_CLEAN_RE.sub("", device).strip()
         )
+        if resolved is None:
+            raise ValueError(f"Unknown device '{device}'")
+        self._device = resolved
 
     # ---------------------------------------------------------------- class-level helpers
+    @classmethod
+    def iter_avds(cls) -> Iterator["AVD"]:
+        yield from _parse_avd_list(_run_lines([*_tool("avdmanager"), "list", "avd"]))
+
     @classmethod
     def get_avds(cls) -> List["AVD"]:
-        output = _run([_TOOLS.avdmanager, "list", "avd"]).stdout.decode().splitlines()
-        return list(_parse_avd_list(output))
+        global _AVD_INDEX
+        avds = list(cls.iter_avds())
+        _AVD_INDEX = {a.name: a for a in avds}
+        return avds
 
     @classmethod
     def get_by_name(cls, name: str) -> "AVD" | None:
-        return next((a for a in cls.get_avds() if a.name == name), None)
+        if _AVD_INDEX is not None:
+            return _AVD_INDEX.get(name)
+        # no index yet → stop parsing at the first match
+        return next((a for a in cls.iter_avds() if a.name == name), None)
 
     # ---------------------------------------------------------------- CRUD
     @classmethod
@@ -303,53 +486,60 @@ class AVD:
         elif isinstance(device, int):
             dev_id = device
         else:
-            match = next(
-                (d for d in Device.get_devices() if d.id_alias == device or d.name == device),
-                None,
+            match = Device._by_alias().get(device) or next(
+                (d for d in Device.get_devices() if d.name == device), None
             )
             if match is None:
                 raise ValueError(f"Unknown device '{device}'")
             dev_id = match.id
 
-        cmd: List[str] = [_TOOLS.avdmanager]
-        cmd += ["--silent" if silent else "--verbose"] if silent or verbose else []
-        cmd += ["create", "avd", "-n", name, "--package", package, "--device", str(dev_id)]
-        for flag, value in {
-            "--sdcard": sdcard,
-            "--tag": tag,
-            "--abi": abi,
-            "--skin": skin,
-            "--path": path,
-        }.items():
-            if value:
-                cmd.extend([flag, str(value)])
-        if force:
-            cmd.append("--force")
-        if snapshot:
-            cmd.append("--snapshot")
-
-        _run(cmd)
+        options = tuple(
+            arg
+            for flag, value in (
+                ("--sdcard", sdcard),
+                ("--tag", tag),
+                ("--abi", abi),
+                ("--skin", skin),
+                ("--path", path),
+            )
+            if value
+            for arg in (flag, str(value))
+        )
+        cmd = (
+            *_tool("avdmanager"),
+            *(("--silent",) if silent else ("--verbose",) if verbose else ()),
+            *cls._CREATE_PREFIX,
+            "-n", name, "--package", package, "--device", str(dev_id),
+            *options,
+            *(("--force",) if force else ()),
+            *(("--snapshot",) if snapshot else ()),
+        )
+
+        _run(list(cmd))
+        _invalidate_avd_index()
         avd = cls.get_by_name(name)
         assert avd, "AVD creation failed"
         return avd
 
     def delete(self) -> bool:
         try:
-            _run([_TOOLS.avdmanager, "delete", "avd", "-n", self.name])
+            _run([*_tool("avdmanager"), "delete", "avd", "-n", self.name])
+            _invalidate_avd_index()
             return True
         except subprocess.CalledProcessError as exc:
-            logger.error("Delete failed: %s", exc.stderr.decode())
+            logger.error("Delete failed: %s", exc.stderr)
             return False
 
     def rename(self, new_name: str) -> bool:
         try:
-            _run([_TOOLS.avdmanager, "move", "avd", "-n", self.name, "-r", new_name])
+            _run([*_tool("avdmanager"), "move", "avd", "-n", self.name, "-r", new_name])
+            _invalidate_avd_index()
             if self.path:
                 self.path = os.path.join(os.path.dirname(self.path), f"{new_name}.avd")
             self.name = new_name
             return True
         except subprocess.CalledProcessError as exc:
-            logger.error("Rename failed: %s", exc.stderr.decode())
+            logger.error("Rename failed: %s", exc.stderr)
             return False
 
     # ---------------------------------------------------------------- runtime control
@@ -357,7 +547,7 @@ class AVD:
         if self.process:
             raise RuntimeError("AVD already started")
 
-        cmd = [_TOOLS.emulator, "-avd", self.name]
+        cmd = [*_tool("emulator"), "-avd", self.name]
         if extra_emulator_args:
             cmd.extend(shlex.split(extra_emulator_args))
 
@@ -372,6 +562,7 @@ class AVD:
         serial = f"emulator-{port}"
         try:
             _adb_client().device(serial).shell(["emu", "kill"])
+            self._serial = None
             logger.info("Stop signal sent to %s", serial)
             return True
         except Exception as exc:  # pragma: no cover
@@ -385,78 +576,214 @@ class AVD:
         self.process.kill()
         self.process.wait()
         self.process = None
+        self._serial = None
         logger.info("Process for %s killed", self.name)
         return True
 
     # ---------------------------------------------------------------- boot helpers
+    @classmethod
+    def _serial_map(cls, *, refresh: bool = False) -> dict[str, str]:
+        """Return ``{product: serial}`` for running emulators (cached briefly)."""
+        global _serial_map_cache
+        with _SERIAL_MAP_LOCK:
+            now = time.monotonic()
+            if (
+                refresh
+                or _serial_map_cache is None
+                or now - _serial_map_cache[0] > _SERIAL_MAP_TTL
+            ):
+                mapping = {
+                    product: info.serial
+                    for info in _adb_client().list(extended=True)
+                    if (product := info.tags.get("product"))
+                }
+                _serial_map_cache = (now, mapping)
+            return _serial_map_cache[1]
+
     def wait_boot_completed(self, timeout: int = 180) -> None:
-        deadline = time.time() + timeout
+        type(self).wait_many([self], timeout)
+
+    @classmethod
+    def wait_many(cls, avds: Iterable["AVD"], timeout: float = 180) -> None:
+        """Wait until every AVD in *avds* reports ``sys.boot_completed``.
+
+        Serials come from the shared ``{product: serial}`` map; an emulator
+        that adb does not list yet is looked up again on later polls until
+        the deadline. Each poll only queries emulators still booting.
+        """
+        deadline = time.monotonic() + timeout
         client = _adb_client()
+        pending = cls._boot_pending(client, avds)
+        for avd, serial in pending.items():
+            avd._serial = serial
+        delay = 0.1  # back off exponentially, capped at 1s
+        while pending and time.monotonic() < deadline:
+            for avd, serial in list(pending.items()):
+                cls._apply_poll(pending, avd, cls._poll_booted(client, avd, serial))
+            if not pending:
+                return
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+        if pending:
+            raise cls._boot_timeout(pending, timeout)
 
-        serial: str | None = None
-        for info in client.list(extended=True):
-            if info.tags.get("product") == self.name:
-                serial = info.serial
-                break
+    @classmethod
+    async def wait_many_async(cls, avds: Iterable["AVD"], timeout: float = 180) -> None:
+        """Like `wait_many`, but each poll round queries all emulators concurrently."""
+        deadline = time.monotonic() + timeout
+        client = _adb_client()
+        pending = await asyncio.to_thread(cls._boot_pending, client, avds)
+        for avd, serial in pending.items():
+            avd._serial = serial
+        delay = 0.1
+        while pending and time.monotonic() < deadline:
+            # workers only report back; `pending` and the AVDs are updated here
+            polled = list(pending.items())
+            results = await asyncio.gather(
+                *(asyncio.to_thread(cls._poll_booted, client, a, s) for a, s in polled)
+            )
+            for (avd, _), result in zip(polled, results):
+                cls._apply_poll(pending, avd, result)
+            if not pending:
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
 
-        if not serial:
-            raise RuntimeError(f"No emulator found for AVD {self.name!r}")
+        if pending:
+            raise cls._boot_timeout(pending, timeout)
 
-        dev = client.device(serial)
-        while time.time() < deadline:
-            try:
-                if dev.shell(["getprop", "sys.boot_completed"]).strip() == "1":
-                    logger.info("Boot completed for %s", self.name)
-                    return
-            except Exception:
-                pass
-            time.sleep(5)
+    @classmethod
+    def _boot_pending(
+        cls, client: adbutils.AdbClient, avds: Iterable["AVD"]
+    ) -> dict["AVD", str | None]:
+        """Map each AVD to its adb serial, or None if adb does not list it yet.
+
+        Remembered serials win while they still check out; the AVDs
+        themselves are left for the caller to update.
+        """
+        pending = {a: a._trusted_serial(client) for a in avds}
+        unresolved = [a for a, serial in pending.items() if serial is None]
+        if unresolved:
+            serials = cls._serial_map()
+            if any(a.name not in serials for a in unresolved):
+                # a stale map may predate an emulator's registration → re-query once
+                serials = cls._serial_map(refresh=True)
+            for a in unresolved:
+                pending[a] = serials.get(a.name)
+        return pending
+
+    def _trusted_serial(self, client: adbutils.AdbClient) -> str | None:
+        """Return the remembered serial if it still belongs to this AVD.
+
+        The emulator may have exited without `kill`/`stop`, and another one
+        reusing its port would otherwise answer the boot poll for it.
+        """
+        serial = self._serial
+        if serial is None or (self.process is not None and self.process.poll() is not None):
+            return None
+        try:
+            dev = client.device(serial)
+            for prop in _AVD_NAME_PROPS:
+                if avd_name := dev.shell(["getprop", prop]).strip():
+                    return serial if avd_name == self.name else None
+        except Exception:
+            pass  # gone, or unreachable → look it up again
+        return None
 
-        raise BootTimeoutError(f"AVD {self.name} failed to boot within {timeout}s")
+    @classmethod
+    def _poll_booted(
+        cls, client: adbutils.AdbClient, avd: "AVD", serial: str | None
+    ) -> tuple[bool, str | None]:
+        """Ask *avd*'s emulator once whether it finished booting.
+
+        Returns whether it has, and the serial to poll next time (it may have
+        shown up, or come back under another one). Only the serial map is
+        shared, so this is safe to run in a worker thread.
+        """
+        if serial is None:
+            # not registered with adb yet
+            if (serial := cls._serial_map().get(avd.name)) is None:
+                return False, None
+        try:
+            if client.device(serial).shell(_BOOT_PROP_CMD).strip() == "1":
+                logger.info("Boot completed for %s", avd.name)
+                return True, serial
+        except Exception:
+            # the emulator may have come back under another serial
+            serial = cls._serial_map().get(avd.name) or serial
+        return False, serial
+
+    @staticmethod
+    def _apply_poll(
+        pending: dict["AVD", str | None], avd: "AVD", result: tuple[bool, str | None]
+    ) -> None:
+        """Record one `_poll_booted` *result* for *avd* (on the caller's thread)."""
+        booted, serial = result
+        avd._serial = serial
+        if booted:
+            del pending[avd]
+        else:
+            pending[avd] = serial
+
+    @staticmethod
+    def _boot_timeout(pending: dict["AVD", str | None], timeout: float) -> BootTimeoutError:
+        names = ", ".join(
+            a.name if serial else f"{a.name} (no emulator found)"
+            for a, serial in pending.items()
+        )
+        return BootTimeoutError(f"AVD {names} failed to boot within {timeout}s")
+
+
+# Installed after @dataclass: a property in the class body would become the
+# default of the `device=` InitVar
+AVD.device = property(AVD._get_device, AVD._set_device)  # type: ignore[assignment]
 
 
 ###############################################################################
 # Internal parser for `avdmanager list avd`
 ###############################################################################
-_AVD_SECTION: Final = re.compile(r"^----+")
+# The two structured lines, searched for directly within a record
+# Alias | Explanation for below: https://docs.google.com/document/d/1x6VT_iAp1p4RuRfNysc2dyF-RFFB8scf/edit
+_AVD_DEVICE_RE: Final = re.compile(r"^[ \t]*Device:[ \t]*(?P<alias>\S+)", re.M | re.I)
 _BASED_ON_RE: Final = re.compile(
-    r"(?P<android>.+?)\s+Tag/ABI:\s+(?P<abi>.+)$"
+    r"^[ \t]*Based on:[ \t]*(?P<android>[^\n]+?)[ \t]+Tag/ABI:[ \t]*(?P<abi>[^\n]+?)[ \t]*$",
+    re.M | re.I,
+)
+
+
+def _set_device_alias(fields: dict[str, Any], m: re.Match[str]) -> None:
+    fields["device"] = m["alias"]
+
+
+def _set_based_on(fields: dict[str, Any], m: re.Match[str]) -> None:
+    fields["based_on"] = sys.intern(m["android"])
+    fields["abi"] = sys.intern(m["abi"])
+
+
+# One AVD record: from its `Name:` line to the end of the chunk
+_AVD_RECORD_RE: Final = re.compile(r"^[ \t]*Name:.*", re.M | re.S)
+_AVD_SCHEMA: Final[dict[str, _Setter]] = {
+    "NAME": _field("name"),
+    "PATH": _field("path"),
+    "TARGET": _field("target"),
+    "SKIN": _field("skin"),
+    "SDCARD": _field("sdcard_size"),
+}
+# "device" holds the alias until it is resolved against the device catalogue
+_AVD_SEARCHES: Final[tuple[_Search, ...]] = (
+    (_AVD_DEVICE_RE, _set_device_alias),
+    (_BASED_ON_RE, _set_based_on),
 )
 
-def _parse_avd_list(lines: Iterable[str]) -> Iterator[AVD]:
-    current = AVD()
-    for raw in lines:
-        line = raw.strip()
-        if not line:
-            continue
-        if _AVD_SECTION.match(line):
-            if not current.is_empty():
-                yield current
-            current = AVD()
-            continue
-        if ":" not in line:
-            continue
-
-        key, value = (s.strip() for s in line.split(":", 1))
-        match key.upper():
-            case "NAME":
-                current.name = value
-            case "DEVICE":
-                current.device = value
-                # Alias | Explanation for below: https://docs.google.com/document/d/1x6VT_iAp1p4RuRfNysc2dyF-RFFB8scf/edit
-                alias = re.match(r"^(\S+)", value).group(1)
-                current.device = alias
-            case "PATH":
-                current.path = value
-            case "TARGET":
-                current.target = value
-            case "SKIN":
-                current.skin = value
-            case "SDCARD":
-                current.sdcard_size = value
-            case "BASED ON":
-                if m := _BASED_ON_RE.match(value):
-                    current.based_on = m["android"].strip()
-                    current.abi = m["abi"].strip()
-    if not current.is_empty():
-        yield current
+def _parse_avd_list(lines: Iterable[str] | str) -> Iterator[AVD]:
+    # alias → Device, fetched on the first DEVICE line and reused for the run
+    by_alias: dict[str | None, Device] | None = None
+    for fields in _parse_records(lines, _AVD_RECORD_RE, _AVD_SCHEMA, _AVD_SEARCHES):
+        if alias := fields.pop("device", None):
+            if by_alias is None:
+                by_alias = Device._by_alias()
+            fields["device"] = by_alias.get(alias)
+        current = AVD(**fields)
+        if not current.is_empty():
+            yield current
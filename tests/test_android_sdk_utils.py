@@ -6,10 +6,12 @@ Scenarios covered
 1. Unsupported tool         → ValueError
 2. Explicit env-var hit
 3. PATH hit (shutil.which)
-4. ANDROID_SDK_ROOT hit
+4. ANDROID_SDK_ROOT hit (platform-tools and cmdline-tools layouts)
 5. Default-root hit
 6. Extra-dirs hit
 7. Nothing found            → FileNotFoundError
+7b. Extra-dirs scan skips pruned directories
+8. Repeated lookups served from the cache
 """
 from __future__ import annotations
 
@@ -41,6 +43,14 @@ def _make_dummy_exe(dir_: Path, stem: str) -> Path:
     return path
 
 
+@pytest.fixture(autouse=True)
+def _clear_lookup_cache():
+    """Every test starts from a cold `find_android_tool` cache."""
+    find_android_tool.cache_clear()
+    yield
+    find_android_tool.cache_clear()
+
+
 # ---------------------------------------------------------------- tests
 def test_invalid_tool_raises():
     with pytest.raises(ValueError):
@@ -76,6 +86,19 @@ def test_sdk_root_hit(tmp_path, monkeypatch):
     assert find_android_tool("adb") == dummy
 
 
+def test_sdk_root_cmdline_tools_hit(tmp_path, monkeypatch):
+    sdk = tmp_path / "sdk"
+    bin_dir = sdk / "cmdline-tools" / "latest" / "bin"
+    bin_dir.mkdir(parents=True)
+    dummy = _make_dummy_exe(bin_dir, "avdmanager")
+
+    monkeypatch.setenv("ANDROID_SDK_ROOT", str(sdk))
+    monkeypatch.delenv("ANDROID_AVDMANAGER", raising=False)
+    monkeypatch.setattr(shutil, "which", lambda *_: None)
+
+    assert find_android_tool("avdmanager") == dummy
+
+
 def test_default_root_hit(tmp_path, monkeypatch):
     default_sdk = tmp_path / "default"
     (default_sdk / "platform-tools").mkdir(parents=True)
@@ -104,6 +127,22 @@ def test_extra_dirs_hit(tmp_path, monkeypatch):
     assert find_android_tool("adb") == dummy
 
 
+def test_extra_dirs_skips_pruned(tmp_path, monkeypatch):
+    extra_root = tmp_path / "extrasdk"
+    pruned_dir = extra_root / "system-images" / "platform-tools"
+    pruned_dir.mkdir(parents=True)
+    _make_dummy_exe(pruned_dir, "adb")
+
+    monkeypatch.setenv("FIND_ANDROID_EXTRA_DIRS", str(extra_root))
+    for var in ("ANDROID_SDK_ROOT", "ANDROID_HOME", "ANDROID_ADB", "PATH"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(at, "_default_sdk_roots", lambda: [])
+    monkeypatch.setattr(shutil, "which", lambda *_: None)
+
+    with pytest.raises(FileNotFoundError):
+        find_android_tool("adb")
+
+
 def test_not_found_raises(monkeypatch):
     # scrub every discovery path
     for var in (
@@ -120,3 +159,20 @@ def test_not_found_raises(monkeypatch):
 
     with pytest.raises(FileNotFoundError):
         find_android_tool("adb")
+
+
+def test_lookup_is_cached(tmp_path, monkeypatch):
+    dummy = _make_dummy_exe(tmp_path, "adb")
+    monkeypatch.setenv("ANDROID_ADB", str(dummy))
+    assert find_android_tool("adb") == dummy
+
+    # same env → cache hit, even though the file is gone
+    dummy.unlink()
+    assert find_android_tool("adb") == dummy
+
+    # env change → fresh lookup
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    other = _make_dummy_exe(other_dir, "adb")
+    monkeypatch.setenv("ANDROID_ADB", str(other))
+    assert find_android_tool("adb") == other
@@ -20,9 +20,10 @@ All host interactions are stubbed, so the suite runs on any machine
 """
 from __future__ import annotations
 
+import os
 import stat
+import subprocess
 import sys
-import textwrap
 import types
 from collections import namedtuple
 from pathlib import Path
@@ -33,89 +34,134 @@ import pytest
 ###############################################################################
 # --- fixture: import module with dummy SDK tools ----------------------------
 ###############################################################################
-@pytest.fixture  # function scope → compatible with monkeypatch
-def au(tmp_path_factory, monkeypatch):
-    """
-    Prepare three tiny dummy SDK binaries, let `find_android_tool`
-    resolve them via env-vars, then import *avd_utils_refactored*.
-    """
+@pytest.fixture(scope="session")
+def _sdk_bin(tmp_path_factory) -> Path:
+    """Write the three tiny dummy SDK binaries once per session."""
     bin_dir = tmp_path_factory.mktemp("sdk_bin")
     for tool in ("avdmanager", "emulator", "adb"):
         p = bin_dir / tool
         p.write_text("#!/bin/sh\n")
         p.chmod(p.stat().st_mode | stat.S_IXUSR)
-        monkeypatch.setenv(f"ANDROID_{tool.upper()}", str(p))
+    return bin_dir
+
+
+@pytest.fixture(scope="session")
+def au():
+    """
+    Import *pyavd* once for the session (tools are only resolved on use).
 
-    # ensure a clean import every time the fixture is invoked
-    sys.modules.pop("pyavd", None)
+    Per-test isolation of the module's caches and of the env-vars pointing
+    at the dummy binaries is handled by `_fresh_state`.
+    """
+    import pyavd.pyavd as mod
 
-    import pyavd as mod
     return mod
 
 
 ###############################################################################
 # --- canned text outputs mimicking `avdmanager list …` ----------------------
 ###############################################################################
-_TARGET_LIST: Final[str] = textwrap.dedent(
-    """
-    ----------
-    id: 1 or "android-34"
-        Name: Android 14
-        Type: Platform
-        API level: 34
-        Revision: 1
-
-    ----------
-    id: 2 or "android-33"
-        Name: Android 13
-        Type: Platform
-        API level: 33
-        Revision: 2
+_TARGET_LIST: Final[str] = """
+----------
+id: 1 or "android-34"
+    Name: Android 14
+    Type: Platform
+    API level: 34
+    Revision: 1
+
+----------
+id: 2 or "android-33"
+    Name: Android 13
+    Type: Platform
+    API level: 33
+    Revision: 2
 """
-)
 
-_DEVICE_LIST: Final[str] = textwrap.dedent(
-    """
-    ---------
-    id: 0 or "pixel"
-        Name: Pixel 4
-        OEM : Google
-        Tag : google
-
-    ---------
-    id: 1 or "Nexus_5X"
-        Name: Nexus 5X
-        OEM : Google
-        Tag : default
+_DEVICE_LIST: Final[str] = """
+---------
+id: 0 or "pixel"
+    Name: Pixel 4
+    OEM : Google
+    Tag : google
+
+---------
+id: 1 or "Nexus_5X"
+    Name: Nexus 5X
+    OEM : Google
+    Tag : default
 """
-)
 
-_AVD_LIST: Final[str] = textwrap.dedent(
-    """
-    --------
-    Name: Pixel_4_API_34
-    Device: pixel (Google Pixel 4)
-    Path: /tmp/.android/Pixel_4_API_34.avd
-    Target: Google APIs (Android 34)
-    Skin: pixel_4
-    Sdcard: 512M
-    Based on: Android 34.0.0 Tag/ABI: google_apis/x86_64
+_AVD_LIST: Final[str] = """
+--------
+Name: Pixel_4_API_34
+Device: pixel (Google Pixel 4)
+Path: /tmp/.android/Pixel_4_API_34.avd
+Target: Google APIs (Android 34)
+Skin: pixel_4
+Sdcard: 512M
+Based on: Android 34.0.0 Tag/ABI: google_apis/x86_64
 """
-)
 
 ###############################################################################
 # --- autouse fixture: share dummy device catalogue --------------------------
 ###############################################################################
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch, au, _sdk_bin):
+    """
+    Give every test empty module-level caches on the shared module, and let
+    `find_android_tool` resolve the dummy binaries via env-vars.
+    """
+    for tool in ("avdmanager", "emulator", "adb"):
+        monkeypatch.setenv(f"ANDROID_{tool.upper()}", str(_sdk_bin / tool))
+    monkeypatch.setattr(au, "_TOOL_CACHE", {})
+    monkeypatch.setattr(au, "_AVD_INDEX", None)
+    monkeypatch.setattr(au, "_serial_map_cache", None)
+    monkeypatch.setattr(au, "_ADB_CLIENT", None)
+    monkeypatch.setattr(au.Device, "_index", (None, {}, {}))
+
+
 @pytest.fixture(autouse=True)
 def _patch_get_devices(monkeypatch, au):
     """
     Provide a reusable dummy device list for every test.
 
-    Individual tests can still override `Device.get_devices` with their own
-    monkey-patch if they need different behaviour.
+    The list is planted in the `Device` catalogue cache, so no test shells
+    out to `avdmanager list device`. Individual tests can still override
+    `Device.get_devices` with their own monkey-patch if they need different
+    behaviour.
     """
     dummy_devices = list(au.Device._parse(_DEVICE_LIST.splitlines()))
-    monkeypatch.setattr(au.Device, "get_devices", lambda: dummy_devices)
+    monkeypatch.setattr(au.Device, "_cache", dummy_devices)
+
+
+###############################################################################
+# --- lazy tool resolution ----------------------------------------------------
+###############################################################################
+def test_tool_resolved_lazily(au, tmp_path):
+    # a fresh interpreter without any SDK must still import the module
+    env = {k: v for k, v in os.environ.items() if not k.startswith(("ANDROID_", "FIND_ANDROID"))}
+    env.update(HOME=str(tmp_path), PATH=str(tmp_path))
+    script = "import pyavd.pyavd as m; assert m._TOOL_CACHE == {}, m._TOOL_CACHE"
+    subprocess.run(
+        [sys.executable, "-c", script], env=env, cwd=Path(au.__file__).parents[1], check=True
+    )
+
+    assert au._tool("adb")[-1].endswith("adb")
+    assert "adb" in au._TOOL_CACHE
+
+
+def test_tool_not_found(monkeypatch, au):
+    def missing(tool):
+        raise FileNotFoundError(tool)
+
+    monkeypatch.setattr(au, "find_android_tool", missing)
+    with pytest.raises(au.AndroidToolNotFound):
+        au._tool("emulator")
+
+
+def test_adb_client_shared(au):
+    client = au._adb_client()
+    assert au._adb_client() is client
 
 
 ###############################################################################
@@ -133,6 +179,40 @@ def test_device_parse(au):
     assert [d.id_alias for d in devices] == ["pixel", "Nexus_5X"]
     assert devices[0].oem == "Google"
     assert devices[1].tag == "default"
+    assert devices[0].oem is devices[1].oem  # interned
+
+
+def test_parse_accepts_raw_text(au):
+    assert list(au.Target._parse(_TARGET_LIST)) == list(
+        au.Target._parse(_TARGET_LIST.splitlines())
+    )
+    assert [d.name for d in au.Device._parse(_DEVICE_LIST)] == ["Pixel 4", "Nexus 5X"]
+    assert [a.name for a in au._parse_avd_list(_AVD_LIST)] == ["Pixel_4_API_34"]
+
+
+def test_separator_must_fill_the_line(au):
+    text = _AVD_LIST.replace("Skin: pixel_4", "Skin: pixel_4\n----not-a-rule")
+    assert len(list(au._chunks(text))) == len(list(au._chunks(text.splitlines()))) == 1
+
+
+def test_run_lines_streams(au):
+    lines = au._run_lines([sys.executable, "-c", "print('a'); print('b')"])
+    assert next(lines) == "a"
+    assert list(lines) == ["b"]
+
+
+def test_run_lines_logs_stderr_on_failure(au, caplog):
+    script = "import sys; print('out'); sys.stderr.write('no JAVA_HOME'); sys.exit(3)"
+    assert list(au._run_lines([sys.executable, "-c", script])) == ["out"]
+    assert "exited 3: no JAVA_HOME" in caplog.text
+
+
+def test_run_lines_timeout(au):
+    script = "import time; print('a', flush=True); time.sleep(30)"
+    lines = au._run_lines([sys.executable, "-c", script], timeout=0.5)
+    assert next(lines) == "a"
+    with pytest.raises(subprocess.TimeoutExpired):
+        next(lines)
 
 
 def test_parse_avd_list(au):
@@ -144,6 +224,84 @@ def test_parse_avd_list(au):
     assert avd.abi == "google_apis/x86_64"
     assert avd.based_on.startswith("Android 34")
 
+
+def test_parse_avd_list_avdmanager_layout(au):
+    # real avdmanager nests "Based on" under Target and right-aligns the keys
+    text = (
+        "Available Android Virtual Devices:\n"
+        "    Name: Nexus_API_30\n"
+        "  Device: Nexus_5X (Google)\n"
+        "    Path: /tmp/.android/avd/Nexus_API_30.avd\n"
+        "  Target: Google APIs (Google Inc.)\n"
+        "          Based on: Android 11.0 (R) Tag/ABI: google_apis/x86\n"
+        "  Sdcard: 512 MB\n"
+    )
+    (avd,) = au._parse_avd_list(text)
+    assert avd.device.id_alias == "Nexus_5X"
+    assert (avd.based_on, avd.abi) == ("Android 11.0 (R)", "google_apis/x86")
+    assert avd.sdcard_size == "512 MB"
+
+
+def test_parse_avd_list_fetches_devices_once(monkeypatch, au):
+    calls = []
+    devices = list(au.Device._parse(_DEVICE_LIST.splitlines()))
+    monkeypatch.setattr(au.Device, "get_devices", lambda: calls.append(1) or devices)
+
+    avds = list(au._parse_avd_list((_AVD_LIST * 3).splitlines()))
+    assert len(avds) == 3
+    assert all(a.device.id_alias == "pixel" for a in avds)
+    assert len(calls) == 1
+
+
+def test_get_by_name_uses_index(monkeypatch, au):
+    calls = []
+
+    def fake_run_lines(cmd):
+        calls.append(cmd)
+        return iter(_AVD_LIST.splitlines())
+
+    monkeypatch.setattr(au, "_run_lines", fake_run_lines)
+    monkeypatch.setattr(au, "_run", lambda cmd, **_: types.SimpleNamespace(stdout="", stderr=""))
+
+    assert au.AVD.get_by_name("Pixel_4_API_34").name == "Pixel_4_API_34"
+    assert len(calls) == 1  # no index yet → streamed lookup
+
+    au.AVD.get_avds()
+    assert au.AVD.get_by_name("Pixel_4_API_34").name == "Pixel_4_API_34"
+    assert au.AVD.get_by_name("missing") is None
+    assert len(calls) == 2
+
+    au.AVD(name="Pixel_4_API_34").delete()  # invalidates the index
+    au.AVD.get_by_name("Pixel_4_API_34")
+    assert len(calls) == 3
+
+def test_device_catalogue_cached(monkeypatch, au):
+    calls = []
+
+    def fake_run_lines(cmd):
+        calls.append(cmd)
+        return iter(_DEVICE_LIST.splitlines())
+
+    monkeypatch.setattr(au, "_run_lines", fake_run_lines)
+
+    cached = au.Device.get_devices()
+    assert au.Device.get_devices() is cached
+    assert calls == []  # primed by the autouse fixture
+
+    au.Device.refresh()
+    assert [d.id_alias for d in au.Device.get_devices()] == ["pixel", "Nexus_5X"]
+    au.Device.get_devices()
+    assert len(calls) == 1
+
+
+def test_device_catalogue_failure_not_cached(monkeypatch, au):
+    listings = iter([[], _DEVICE_LIST.splitlines()])
+    monkeypatch.setattr(au, "_run_lines", lambda cmd: iter(next(listings)))
+
+    au.Device.refresh()
+    assert au.Device.get_devices() == []  # avdmanager failed
+    assert [d.id_alias for d in au.Device.get_devices()] == ["pixel", "Nexus_5X"]
+
 ###############################################################################
 # --- AVD.device property -----------------------------------------------------
 ###############################################################################
@@ -152,33 +310,53 @@ def test_device_lookup_by_alias(au):
     avd.device = "pixel (Google Pixel 4)"
     assert avd.device and avd.device.id_alias == "pixel"
 
+    avd.device = "Nexus_5X (Google)"  # avdmanager's "alias (OEM)" form
+    assert avd.device.id_alias == "Nexus_5X"
+
+
+def test_avd_dataclass_contract(au):
+    import dataclasses
+
+    avd = au.AVD(name="x", device="Nexus_5X (Google)")  # resolved like the setter
+    copy = dataclasses.replace(avd, name="y")
+    assert (copy.name, copy.device) == ("y", avd.device)
+    assert copy.device.id_alias == "Nexus_5X"
+    with pytest.raises(TypeError):
+        au.AVD(process=None)  # runtime state is not an init field
+
+
+def test_device_lookup_unknown(au):
+    with pytest.raises(ValueError):
+        au.AVD().device = "does-not-exist"
+
 ###############################################################################
 # --- AVD.create command-builder ---------------------------------------------
 ###############################################################################
-def _dummy_run_collector() -> types.SimpleNamespace:
+class _Recorder:
     """
-    Return a namespace that captures the last command given to the fake _run.
+    Fake `_run` that records every command it is given, in call order.
     """
-    ns = types.SimpleNamespace(cmd=None)
 
-    def fake_run(cmd: List[str], **_):
-        ns.cmd = cmd
-        # mimic subprocess.CompletedProcess
-        return types.SimpleNamespace(stdout=b"", stderr=b"")
+    __slots__ = ("calls",)
 
-    ns.fake = fake_run
-    return ns
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def __call__(self, cmd: List[str], **_):
+        self.calls.append(cmd)
+        # mimic subprocess.CompletedProcess
+        return types.SimpleNamespace(stdout="", stderr="")
 
 
 def test_avd_create_happy(monkeypatch, au):
     # capture generated command
-    recorder = _dummy_run_collector()
-    monkeypatch.setattr(au, "_run", recorder.fake)
+    rec = _Recorder()
+    monkeypatch.setattr(au, "_run", rec)
 
     # Locate the real implementation module without importing anything new
     import sys
     core = sys.modules[au.AVD.__module__]  # the module where AVD (and _run) live
-    monkeypatch.setattr(core, "_run", recorder.fake)
+    monkeypatch.setattr(core, "_run", rec)
 
     # fake success of get_by_name so .create returns normally
     monkeypatch.setattr(
@@ -201,7 +379,7 @@ def test_avd_create_happy(monkeypatch, au):
         "--device",
         "0",  # id for "pixel"
     ]
-    assert recorder.cmd[-len(expected_tail) :] == expected_tail
+    assert rec.calls[-1][-len(expected_tail) :] == expected_tail
 
 
 def test_avd_create_unknown_device(monkeypatch, au):
@@ -211,47 +389,163 @@ def test_avd_create_unknown_device(monkeypatch, au):
 ###############################################################################
 # --- boot-completed helper ---------------------------------------------------
 ###############################################################################
-def test_wait_boot_completed_success(monkeypatch, au):
-    avd = au.AVD(name="Pixel_4_API_34")
+_Info = namedtuple("_Info", "serial tags")
+_PIXEL: Final = {"Pixel_4_API_34": "emulator-5554"}
+
+
+def _fake_adb(monkeypatch, au, listings, shell) -> List[dict]:
+    """
+    Point `_adb_client()` at a fake adb server.
+
+    *listings* are the ``{product: serial}`` maps reported by successive
+    ``adb devices -l`` calls (the last one repeats); *shell(serial)* answers
+    ``getprop sys.boot_completed``, while the AVD-name property reports the
+    product from the latest listing. Returns the listings served so far.
+    """
+    served: List[dict] = []
 
-    class DummyDev:
-        def shell(self, _):
-            return "1"  # booted
+    def list_devices(*, extended=False):
+        served.append(listings[min(len(served), len(listings) - 1)])
+        return [_Info(serial, {"product": p}) for p, serial in served[-1].items()]
 
-    Info = namedtuple("Info", "serial tags")
+    def answer(serial, cmd):
+        if cmd == ["getprop", au._AVD_NAME_PROPS[0]]:
+            current = served[-1] if served else listings[-1]
+            return next((p for p, s in current.items() if s == serial), "")
+        return shell(serial)
 
-    class DummyClient:
-        def list(self, *, extended=False):
-            return [Info(serial="emulator-5554", tags={"product": "Pixel_4_API_34"})]
+    def device(serial):
+        return types.SimpleNamespace(serial=serial, shell=lambda cmd: answer(serial, cmd))
 
-        def device(self, _serial):
-            return DummyDev()
+    client = types.SimpleNamespace(list=list_devices, device=device)
+    monkeypatch.setattr(au, "_adb_client", lambda: client)
+    return served
 
-    monkeypatch.setattr(au, "_adb_client", lambda: DummyClient())
+
+def test_wait_boot_completed_success(monkeypatch, au):
+    _fake_adb(monkeypatch, au, [_PIXEL], lambda _s: "1")
     monkeypatch.setattr(au.time, "sleep", lambda _x: None)
 
     # should not raise
+    au.AVD(name="Pixel_4_API_34").wait_boot_completed(timeout=5)
+
+
+def test_wait_boot_completed_backs_off(monkeypatch, au):
+    answers = iter(["0", "0", "0", "1"])
+    _fake_adb(monkeypatch, au, [_PIXEL], lambda _s: next(answers))
+    sleeps: list[float] = []
+    monkeypatch.setattr(au.time, "sleep", sleeps.append)
+
+    au.AVD(name="Pixel_4_API_34").wait_boot_completed(timeout=60)
+    assert sleeps == [0.1, 0.2, 0.4]
+
+
+def test_wait_boot_completed_requeries_serials(monkeypatch, au):
+    _fake_adb(monkeypatch, au, [{}, _PIXEL], lambda _s: "1")
+    monkeypatch.setattr(au.time, "sleep", lambda _x: None)
+
+    au.AVD._serial_map()  # warm the cache before the emulator shows up
+    au.AVD(name="Pixel_4_API_34").wait_boot_completed(timeout=5)
+    assert au.AVD._serial_map() == _PIXEL
+
+
+def test_wait_boot_completed_waits_for_registration(monkeypatch, au):
+    _fake_adb(monkeypatch, au, [{}, {}, {}, _PIXEL], lambda _s: "1")
+    monkeypatch.setattr(au, "_SERIAL_MAP_TTL", -1)  # re-list on every poll
+    monkeypatch.setattr(au.time, "sleep", lambda _x: None)
+
+    avd = au.AVD(name="Pixel_4_API_34")
     avd.wait_boot_completed(timeout=5)
+    assert avd._serial == "emulator-5554"
 
 
-def test_wait_boot_completed_timeout(monkeypatch, au):
+def test_wait_boot_completed_remembers_serial(monkeypatch, au):
+    served = _fake_adb(monkeypatch, au, [_PIXEL], lambda _s: "1")
+    monkeypatch.setattr(au.time, "sleep", lambda _x: None)
+
     avd = au.AVD(name="Pixel_4_API_34")
+    avd.wait_boot_completed(timeout=5)
+    monkeypatch.setattr(au, "_serial_map_cache", None)  # force a miss on re-list
+    avd.wait_boot_completed(timeout=5)
+    assert len(served) == 1
 
-    class DummyDev:
-        def shell(self, _):
-            return "0"  # never booted
 
-    Info = namedtuple("Info", "serial tags")
+def test_wait_boot_completed_rechecks_remembered_serial(monkeypatch, au):
+    # another emulator took over emulator-5554; ours now runs on 5556
+    listing = {"Other_AVD": "emulator-5554", "Pixel_4_API_34": "emulator-5556"}
+    _fake_adb(monkeypatch, au, [listing], lambda serial: str(int(serial == "emulator-5556")))
+    monkeypatch.setattr(au.time, "sleep", lambda _x: None)
+
+    avd = au.AVD(name="Pixel_4_API_34")
+    avd._serial = "emulator-5554"
+    avd.wait_boot_completed(timeout=5)
+    assert avd._serial == "emulator-5556"
 
-    class DummyClient:
-        def list(self, *, extended=False):
-            return [Info(serial="emulator-5554", tags={"product": "Pixel_4_API_34"})]
+    avd.process = types.SimpleNamespace(poll=lambda: 0)  # emulator exited
+    assert avd._trusted_serial(au._adb_client()) is None
 
-        def device(self, _serial):
-            return DummyDev()
 
-    monkeypatch.setattr(au, "_adb_client", lambda: DummyClient())
+def test_wait_many_polls_only_pending(monkeypatch, au):
+    polls: list[str] = []
+    booted_after = {"emulator-5554": 1, "emulator-5556": 3}
+
+    def shell(serial):
+        polls.append(serial)
+        return "1" if polls.count(serial) >= booted_after[serial] else "0"
+
+    _fake_adb(monkeypatch, au, [{"a": "emulator-5554", "b": "emulator-5556"}], shell)
     monkeypatch.setattr(au.time, "sleep", lambda _x: None)
 
+    au.AVD.wait_many([au.AVD(name="a"), au.AVD(name="b")], timeout=5)
+    assert polls == ["emulator-5554", "emulator-5556", "emulator-5556", "emulator-5556"]
+
+
+def test_wait_many_async(monkeypatch, au):
+    import asyncio
+
+    answers = {"emulator-5554": iter(["0", "1"]), "emulator-5556": iter(["1"])}
+    _fake_adb(
+        monkeypatch,
+        au,
+        [{"a": "emulator-5554", "b": "emulator-5556"}],
+        lambda serial: next(answers[serial]),
+    )
+
+    async def no_sleep(_x):
+        pass
+
+    monkeypatch.setattr(au.asyncio, "sleep", no_sleep)
+
+    asyncio.run(au.AVD.wait_many_async([au.AVD(name="a"), au.AVD(name="b")], timeout=5))
+
+    with pytest.raises(au.BootTimeoutError):
+        asyncio.run(au.AVD.wait_many_async([au.AVD(name="a")], timeout=0))
+
+
+def test_poll_booted_only_reports(monkeypatch, au):
+    _fake_adb(monkeypatch, au, [_PIXEL], lambda _s: "0")
+    avd = au.AVD(name="Pixel_4_API_34")
+
+    # safe for worker threads: the result is returned, nothing is mutated
+    assert au.AVD._poll_booted(au._adb_client(), avd, None) == (False, "emulator-5554")
+    assert avd._serial is None
+
+
+def test_wait_boot_completed_timeout(monkeypatch, au):
+    polls = []
+    _fake_adb(monkeypatch, au, [_PIXEL], lambda _s: polls.append(1) or "0")  # never booted
+
+    # virtual clock: only sleeping moves time forward
+    now = [0.0]
+
+    def fake_sleep(secs):
+        now[0] += secs
+
+    monkeypatch.setattr(au.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(au.time, "sleep", fake_sleep)
+
     with pytest.raises(au.BootTimeoutError):
-        avd.wait_boot_completed(timeout=0)
\ No newline at end of file
+        au.AVD(name="Pixel_4_API_34").wait_boot_completed(timeout=5)
+    # 0.1 + 0.2 + 0.4 + 0.8 + 1 + 1 + 1 + 1 ≥ 5 → eight sleeps, eight polls
+    assert len(polls) == 8
+    assert now[0] >= 5